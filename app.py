@@ -9,6 +9,7 @@ import zipfile
 from litemapy import Schematic
 
 from schem.analyzer import RequirementAnalyzer
+from schem.cache import CachedSchematic
 from schem.item import ComplexRecipeComponent, InterchangeableItem, InterchangeableItemStack, Item, ItemStack, \
     RecipeComponent, Tag, TagStack
 from schem.recipe import Recipe, RecipeCollection, RecipeConfiguration, RecipeMethod
@@ -51,7 +52,7 @@ class App:
         self.config = AppConfiguration()
         ...
 
-    def analyze(self, schematic: Schematic, config: RecipeConfiguration):
+    def analyze(self, schematic: Union[Schematic, CachedSchematic], config: RecipeConfiguration):
         """Opens the analysis screen for a schematic within the app."""
         self.active_schematic = RequirementAnalyzer(schematic, config, self.config.all_recipes)
         print(f"> SCHEMATIC LOADED: ({schematic.name})")
@@ -7,6 +7,7 @@ from litemapy import Schematic
 
 from schem.item import Item, Stack, Tag
 from schem.analyzer import RequirementAnalyzer
+from schem.cache import SchematicCache
 from schem.recipe import Recipe, RecipeMethod, RecipeConfiguration
 from app import App, AppConfiguration
 
@@ -21,4 +22,5 @@ app = App()
 app.config.set_jar_path(sys.argv[1])
 app.load_all_data()
 print()
-app.analyze(Schematic.load("1.18 Base.litematic"), RecipeConfiguration())
+cache = SchematicCache(".schem_cache")
+app.analyze(cache.load("1.18 Base.litematic"), RecipeConfiguration())
@@ -1,3 +1,4 @@
 from .item import *
 from .recipe import *
 from .analyzer import *
+from .cache import *
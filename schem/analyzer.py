@@ -1,7 +1,8 @@
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterator, Union
 
 from litemapy import Schematic
 
+from .cache import CachedSchematic
 from .item import Item, ItemStack
 from .recipe import RecipeConfiguration, RecipeCollection
 
@@ -41,14 +42,15 @@ class RecipeNode:
 
 class RequirementAnalyzer:
     """A type simplifying the deduction of recipe ingredients based on user choices."""
-    schematic: Schematic
+    schematic: Union[Schematic, CachedSchematic]
     config: RecipeConfiguration
     recipes: dict[Item, RecipeCollection]
     materials: dict[Item, int]
     trees: list[RecipeNode]
     outstanding_nodes: list[RecipeNode]
 
-    def __init__(self, schematic: Schematic, config: RecipeConfiguration, recipes: dict[Item, RecipeCollection]):
+    def __init__(self, schematic: Union[Schematic, CachedSchematic], config: RecipeConfiguration,
+                 recipes: dict[Item, RecipeCollection]):
         self.schematic = schematic
         self.config = config
         self.recipes = recipes
@@ -90,16 +92,23 @@ class RequirementAnalyzer:
 
     def _calculate_material_counts(self):
         materials = {}
-        for region in self.schematic.regions.values():
-            for x, y, z in region.allblockpos():
-                block = region.getblock(x, y, z)
-                if block.blockid != "minecraft:air":
-                    item = Item.from_identifier(block.blockid)
-                    c = materials.get(item, 0)
-                    materials[item] = c + 1
+        for blockid, count in self._block_counts():
+            if blockid != "minecraft:air":
+                item = Item.from_identifier(blockid)
+                materials[item] = materials.get(item, 0) + count
 
         for item, count in materials.items():
             self.trees.append(RecipeNode(ItemStack(item, count)))
 
         self.materials = materials
         self.outstanding_nodes = self.trees.copy()
+
+    def _block_counts(self) -> Iterator[tuple[str, int]]:
+        """Yields (block id, count) pairs for every region, which may repeat block ids across regions."""
+        if isinstance(self.schematic, CachedSchematic):  # count straight from the memory-mapped block indices
+            for region in self.schematic.regions.values():
+                yield from region.block_counts().items()
+        else:
+            for region in self.schematic.regions.values():
+                for x, y, z in region.allblockpos():
+                    yield region.getblock(x, y, z).blockid, 1
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Optional
+
+import litemapy
+import numpy as np
+from litemapy import Schematic
+
+_META_FILE = "meta.json"
+_FORMAT_VERSION = 2  # bump whenever the layout of stored entries changes
+_CHUNK_SIZE = 1 << 20
+_TMP_PREFIX = ".tmp-"
+_TMP_GRACE = 60 * 60  # seconds before an unfinished temp directory is treated as abandoned
+
+
+def _file_hash(path: str) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _directory_size(path: str) -> int:
+    try:
+        return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+    except FileNotFoundError:  # removed by another process
+        return 0
+
+
+def _region_arrays(region) -> tuple[np.ndarray, np.ndarray]:
+    """Returns a litemapy region's block id palette and the block indices into it."""
+    states = np.array([block.blockid for block in region.palette], dtype=np.str_)
+    # the palette has one entry per block state; merge states sharing an id so each id is counted once
+    palette, inverse = np.unique(states, return_inverse=True)
+    # litemapy exposes no public accessor for the unpacked block array, so it is read directly
+    blocks = inverse.astype(np.min_scalar_type(len(palette)))[region._Region__blocks]
+    return palette, blocks
+
+
+def _region_meta(name: str, region) -> dict:
+    return {
+        "name": name, "x": region.x, "y": region.y, "z": region.z,
+        "width": region.width, "height": region.height, "length": region.length,
+    }
+
+
+def _cache_key(path: str) -> str:
+    """Returns the cache key for a file: its content hash plus the cache format and litemapy versions, since entries
+    are built from litemapy's private region layout."""
+    return f"{_file_hash(path)}-v{_FORMAT_VERSION}-{getattr(litemapy, '__version__', 'unknown')}"
+
+
+class CachedRegion:
+    """A schematic region backed by memory-mapped palette and block index arrays.
+
+    Block indices are stored in litemapy's internal layout, so index (0, 0, 0) is the region's minimum corner in its
+    own coordinate system."""
+    name: str
+    x: int
+    y: int
+    z: int
+    width: int
+    height: int
+    length: int
+    palette: np.ndarray  # unique block identifiers, indexed by the values in `blocks`
+    blocks: np.ndarray  # palette indices, shape (|width|, |height|, |length|)
+
+    def __init__(self, name: str, meta: dict, palette: np.ndarray, blocks: np.ndarray):
+        self.name = name
+        self.x, self.y, self.z = meta["x"], meta["y"], meta["z"]
+        self.width, self.height, self.length = meta["width"], meta["height"], meta["length"]
+        self.palette = palette
+        self.blocks = blocks
+
+    def _store_offset(self) -> tuple[int, int, int]:
+        """Returns the offset converting region coordinates into indices of `blocks`."""
+        return tuple(-(size + 1) if size < 0 else 0 for size in (self.width, self.height, self.length))
+
+    def block_counts(self, blocks: Optional[np.ndarray] = None) -> dict[str, int]:
+        """Returns the number of occurrences of each block identifier, optionally within a subset of `blocks`."""
+        if blocks is None:
+            blocks = self.blocks
+        counts = np.bincount(blocks.ravel(), minlength=len(self.palette))
+        return {str(self.palette[i]): int(c) for i, c in enumerate(counts) if c}
+
+    def sub_volume(self, start: tuple[int, int, int], end: tuple[int, int, int]) -> np.ndarray:
+        """Returns a zero-copy view of the block indices between two inclusive corners in region coordinates."""
+        offset = self._store_offset()
+        slices = tuple(
+            slice(min(a, b) + o, max(a, b) + o + 1) for a, b, o in zip(start, end, offset)
+        )
+        return self.blocks[slices]
+
+    def __repr__(self) -> str:
+        return f"<CachedRegion {self.name} size={self.blocks.shape} palette={len(self.palette)}>"
+
+
+class CachedSchematic:
+    """A lightweight, read-only stand-in for a litemapy Schematic loaded from the decode cache."""
+    name: str
+    regions: dict[str, CachedRegion]
+
+    def __init__(self, name: str, regions: dict[str, CachedRegion]):
+        self.name = name
+        self.regions = regions
+
+    def __repr__(self) -> str:
+        return f"<CachedSchematic {self.name} regions={len(self.regions)}>"
+
+
+class SchematicCache:
+    """Caches decoded schematic regions on disk, keyed by the content hash of the source file.
+
+    Each entry holds a region's palette and unpacked block indices as .npy files that are memory-mapped on load, so
+    repeated runs against an unchanged file skip gzip, NBT and block-state decoding entirely. Entries are evicted
+    least-recently-used first once the cache directory exceeds `max_bytes`."""
+    directory: str
+    max_bytes: int
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, path: str) -> CachedSchematic:
+        """Returns the cached schematic for a file, decoding and storing it first if it is not already cached."""
+        key = _cache_key(path)
+        entry = os.path.join(self.directory, key)
+        try:
+            return self._open(entry)
+        except FileNotFoundError:  # not cached yet, or evicted by another process while opening
+            pass
+
+        schematic = Schematic.load(path)
+        self._store(schematic, entry)
+        self._evict(keep=key)
+        try:
+            return self._open(entry)
+        except FileNotFoundError:  # evicted again before it could be opened; serve the decoded data directly
+            return self._from_schematic(schematic)
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        for entry in os.scandir(self.directory):
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _store(self, schematic: Schematic, entry: str) -> None:
+        # build the entry in a temporary directory and move it into place so readers never see a partial entry
+        tmp = tempfile.mkdtemp(dir=self.directory, prefix=_TMP_PREFIX)
+        try:
+            regions = []
+            for i, (name, region) in enumerate(schematic.regions.items()):
+                palette, blocks = _region_arrays(region)
+                np.save(os.path.join(tmp, f"{i}.palette.npy"), palette)
+                np.save(os.path.join(tmp, f"{i}.blocks.npy"), blocks)
+                regions.append(_region_meta(name, region))
+
+            with open(os.path.join(tmp, _META_FILE), "w", encoding="utf-8") as f:
+                json.dump({"version": _FORMAT_VERSION, "name": schematic.name, "regions": regions}, f)
+
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                if os.path.isfile(os.path.join(entry, _META_FILE)):  # another process stored the same entry first
+                    shutil.rmtree(tmp, ignore_errors=True)
+                else:  # a previous run left an incomplete entry behind; replace it
+                    shutil.rmtree(entry, ignore_errors=True)
+                    try:
+                        os.rename(tmp, entry)
+                    except OSError:  # another process replaced it first
+                        shutil.rmtree(tmp, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    def _open(self, entry: str) -> CachedSchematic:
+        """Memory-maps a stored entry and marks it as most recently used. Raises FileNotFoundError if the entry is
+        missing or incomplete."""
+        with open(os.path.join(entry, _META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        regions = {}
+        for i, region in enumerate(meta["regions"]):
+            regions[region["name"]] = CachedRegion(
+                region["name"],
+                region,
+                np.load(os.path.join(entry, f"{i}.palette.npy"), mmap_mode="r"),
+                np.load(os.path.join(entry, f"{i}.blocks.npy"), mmap_mode="r"),
+            )
+        os.utime(entry)
+        return CachedSchematic(meta["name"], regions)
+
+    @staticmethod
+    def _from_schematic(schematic: Schematic) -> CachedSchematic:
+        """Builds an in-memory CachedSchematic without going through the cache directory."""
+        regions = {}
+        for name, region in schematic.regions.items():
+            palette, blocks = _region_arrays(region)
+            regions[name] = CachedRegion(name, _region_meta(name, region), palette, blocks)
+        return CachedSchematic(schematic.name, regions)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Removes least recently used entries until the cache fits within its size limit.
+
+        Temp directories from in-progress stores count towards the limit; those older than `_TMP_GRACE` were left by
+        interrupted runs and are removed."""
+        entries = []
+        total = 0
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            try:
+                if not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:  # removed by another process
+                continue
+            size = _directory_size(entry.path)
+            if entry.name.startswith(_TMP_PREFIX):
+                if now - mtime > _TMP_GRACE:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    total += size
+            elif not entry.name.startswith("."):
+                entries.append((mtime, entry.name, size))
+                total += size
+
+        for _, name, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+            total -= size
@@ -0,0 +1,139 @@
+import os
+import shutil
+import time
+from collections import Counter
+
+from litemapy import BlockState, Region, Schematic
+
+from schem.analyzer import RequirementAnalyzer
+from schem.cache import _TMP_GRACE, _cache_key, CachedSchematic, SchematicCache
+from schem.item import Item
+from schem.recipe import RecipeConfiguration
+
+
+def _multi_state_schematic(path: str) -> None:
+    region = Region(0, 0, 0, -3, 2, 4)  # negative width exercises litemapy's store offset
+    region[0, 0, 0] = BlockState("minecraft:oak_stairs", facing="north")
+    region[-1, 0, 0] = BlockState("minecraft:oak_stairs", facing="south")
+    region[-2, 0, 0] = BlockState("minecraft:oak_stairs", facing="south")
+    region[0, 1, 1] = BlockState("minecraft:oak_slab", type="top")
+    region[0, 1, 2] = BlockState("minecraft:oak_slab", type="bottom")
+    region[-1, 1, 3] = BlockState("minecraft:stone")
+    region.as_schematic(name="multi_state").save(path)
+
+
+def _litemapy_counts(schematic: Schematic) -> Counter:
+    counts = Counter()
+    for region in schematic.regions.values():
+        for x, y, z in region.allblockpos():
+            counts[region.getblock(x, y, z).blockid] += 1
+    return counts
+
+
+def test_cached_counts_match_litemapy(tmp_path):
+    path = str(tmp_path / "multi_state.litematic")
+    _multi_state_schematic(path)
+    cache = SchematicCache(str(tmp_path / "cache"))
+
+    expected = _litemapy_counts(Schematic.load(path))
+    for schematic in (cache.load(path), cache.load(path)):  # cold then warm
+        counts = Counter()
+        for region in schematic.regions.values():
+            counts.update(region.block_counts())
+        assert counts == expected
+        assert counts["minecraft:oak_stairs"] == 3
+
+
+def test_analyzer_paths_agree(tmp_path, monkeypatch):
+    path = str(tmp_path / "multi_state.litematic")
+    _multi_state_schematic(path)
+    monkeypatch.setattr(Item, "all", {})
+    for identifier in ("minecraft:oak_stairs", "minecraft:oak_slab", "minecraft:stone"):
+        Item.register(identifier, identifier)
+
+    cached = SchematicCache(str(tmp_path / "cache")).load(path)
+    assert type(cached) is CachedSchematic
+    from_cache = RequirementAnalyzer(cached, RecipeConfiguration(), {}).materials
+    from_file = RequirementAnalyzer(Schematic.load(path), RecipeConfiguration(), {}).materials
+    assert from_cache == from_file
+    assert from_cache[Item.from_identifier("minecraft:oak_stairs")] == 3
+
+
+def test_sub_volume(tmp_path):
+    path = str(tmp_path / "multi_state.litematic")
+    _multi_state_schematic(path)
+    region, = SchematicCache(str(tmp_path / "cache")).load(path).regions.values()
+
+    counts = region.block_counts(region.sub_volume((-2, 0, 0), (0, 0, 0)))
+    assert counts == {"minecraft:oak_stairs": 3}
+
+
+def test_incomplete_entry_is_replaced(tmp_path):
+    path = str(tmp_path / "multi_state.litematic")
+    _multi_state_schematic(path)
+    cache = SchematicCache(str(tmp_path / "cache"))
+
+    cache.load(path)
+    entry, = os.listdir(cache.directory)
+    os.remove(os.path.join(cache.directory, entry, "meta.json"))  # simulate a crash mid-write
+
+    region, = cache.load(path).regions.values()
+    assert region.block_counts()["minecraft:oak_stairs"] == 3
+
+
+def _single_block_schematic(path: str, blockid: str) -> None:
+    region = Region(0, 0, 0, 2, 2, 2)
+    region[0, 0, 0] = BlockState(blockid)
+    region.as_schematic(name=os.path.basename(path)).save(path)
+
+
+def test_eviction_is_least_recently_used(tmp_path):
+    paths = {}
+    for name, blockid in (("a", "minecraft:stone"), ("b", "minecraft:dirt"), ("c", "minecraft:sand")):
+        paths[name] = str(tmp_path / f"{name}.litematic")
+        _single_block_schematic(paths[name], blockid)
+
+    cache = SchematicCache(str(tmp_path / "cache"))
+    cache.load(paths["a"])
+    entry_size = sum(f.stat().st_size for d in os.scandir(cache.directory) for f in os.scandir(d.path))
+    cache.max_bytes = entry_size * 2 + entry_size // 2  # room for two entries
+
+    for name in ("b", "a", "c"):  # reloading A makes B the least recently used entry
+        time.sleep(0.01)
+        cache.load(paths[name])
+
+    remaining = set(os.listdir(cache.directory))
+    assert _cache_key(paths["a"]) in remaining and _cache_key(paths["c"]) in remaining
+    assert _cache_key(paths["b"]) not in remaining
+
+
+def test_abandoned_temp_directories_are_removed(tmp_path):
+    path = str(tmp_path / "a.litematic")
+    _single_block_schematic(path, "minecraft:stone")
+    cache = SchematicCache(str(tmp_path / "cache"), max_bytes=0)
+
+    orphan = os.path.join(cache.directory, ".tmp-orphan")
+    os.mkdir(orphan)
+    with open(os.path.join(orphan, "0.blocks.npy"), "wb") as f:
+        f.write(b"0" * 1024)
+    stale = time.time() - _TMP_GRACE - 1
+    os.utime(orphan, (stale, stale))
+
+    cache.load(path)
+    assert not os.path.exists(orphan)
+
+
+def test_entry_evicted_during_load(tmp_path, monkeypatch):
+    path = str(tmp_path / "multi_state.litematic")
+    _multi_state_schematic(path)
+    cache = SchematicCache(str(tmp_path / "cache"))
+    cache.load(path)
+
+    def evict_then_open(entry):  # another process evicts the entry before every open
+        shutil.rmtree(entry, ignore_errors=True)
+        return open_entry(entry)
+
+    open_entry = cache._open
+    monkeypatch.setattr(cache, "_open", evict_then_open)
+    region, = cache.load(path).regions.values()
+    assert region.block_counts()["minecraft:oak_stairs"] == 3